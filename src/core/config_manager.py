@@ -1,8 +1,26 @@
 from pathlib import Path
-from typing import Optional, Iterator, List
-from yaml import safe_load
+from typing import Any, Optional, Iterator, List
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Configuration files larger than this (in bytes) are streamed tag by tag instead of loaded at once.
+_STREAMING_THRESHOLD = 1024 * 1024
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+_MAP_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+
+# Yielded by ConfigManager._load_yaml_streaming when the configuration has no tags.
+_NO_TAGS = object()
+
+
+class ConfigLoadError(Exception):
+    """Error while loading the YAML configuration file."""
+
 
 class ConfigManager:
     """
@@ -10,7 +28,9 @@ class ConfigManager:
 
     Attributes:
         _path (Path): The path to the YAML file.
-        _yaml (dict): The loaded YAML content.
+        _streaming (bool): Whether the YAML file is streamed tag by tag instead of loaded at once.
+        _yaml (Optional[dict]): The loaded YAML content. Not loaded if the file is streamed.
+        _tags_cache (Optional[list]): The validated tags and their properties, built on first access.
     """
 
     def __init__(self, yaml_path: Path):
@@ -21,26 +41,46 @@ class ConfigManager:
             yaml_path (Path): The path to the YAML configuration file.
 
         Raises:
-            FileNotFoundError: If the YAML file does not exist.
-            yaml.YAMLError: If there is an error reading the YAML file.
+            ConfigLoadError: If the YAML file does not exist or cannot be read.
         """
         self._path = yaml_path
-        self._yaml = self._load_yaml(yaml_path)
+        self._streaming = self._use_streaming(yaml_path)
+        self._yaml: Optional[dict] = None
+        if not self._streaming:
+            self._yaml = self._load_yaml(yaml_path) or {}
+        self._tags_cache: Optional[list[tuple[Optional[str], Optional[list[dict]]]]] = None
 
     def get_next_tag(self) -> Iterator[tuple[Optional[str], Optional[list[dict]]]]:
         """
         Retrieve the next valid tag and its properties from the YAML configuration.
 
+        The tags are validated once and cached, so repeated iteration does not
+        validate them again. Large configuration files are streamed instead and
+        each tag is validated as soon as it has been read.
+
         Yields:
             tuple[Optional[str], Optional[list[dict]]]: The tag name and its properties.
         """
-        if self._yaml.get("tags") is None:
-            self._print_error("No tags found.")
-            yield None, None
+        if self._streaming:
+            for tag in self._load_yaml_streaming(self._path):
+                if tag is _NO_TAGS:
+                    self._print_error("No tags found.")
+                    yield None, None
+                elif self._validate_tag(tag):
+                    yield tag.get("tag"), self._validate_properties(tag)
+            return
+
+        if self._tags_cache is None:
+            self._tags_cache = []
+            if self._yaml.get("tags") is None:
+                self._print_error("No tags found.")
+                self._tags_cache.append((None, None))
+
+            for tag in self._yaml.get("tags") or []:
+                if self._validate_tag(tag):
+                    self._tags_cache.append((tag.get("tag"), self._validate_properties(tag)))
 
-        for tag in self._yaml.get("tags", []):
-            if self._validate_tag(tag):
-                yield tag.get("tag"), self._validate_properties(tag)
+        yield from self._tags_cache
 
     def _validate_tag(self, tag: dict) -> bool:
         """
@@ -56,13 +96,15 @@ class ConfigManager:
             self._print_error("No tag found.")
             return False
 
-        if not isinstance(tag.get("properties"), list):
+        prop_list = tag.get("properties")
+        if not isinstance(prop_list, list):
             self._print_error(f"Properties for tag {tag} must be a list.")
             return False
 
-        if not all(isinstance(prop, dict) for prop in tag.get("properties")):
-            self._print_error(f"Properties for tag {tag} must be a list of dictionaries.")
-            return False
+        for prop in prop_list:
+            if type(prop) is not dict:
+                self._print_error(f"Properties for tag {tag} must be a list of dictionaries.")
+                return False
 
         return True
 
@@ -77,22 +119,22 @@ class ConfigManager:
             list[dict]: A list of valid properties.
         """
         properties: List[dict] = []
+        tag_name = tag.get("tag")
         for prop in tag.get("properties", []):
-            action = prop.get("action")
-            tag_name = tag.get("tag")
+            action, old, new = prop.get("action"), prop.get("old"), prop.get("new")
             if not action:
                 self._print_error(f"No action defined for properties in tag: {tag_name}.")
                 continue
 
-            if action in ["rename", "remove"] and not prop.get("old"):
+            if action in ["rename", "remove"] and not old:
                 self._print_error(f"Old property for action: {action} in tag: {tag_name} not found.")
                 continue
 
-            if action in ["rename", "add"] and not prop.get("new"):
+            if action in ["rename", "add"] and not new:
                 self._print_error(f"New property for action: {action} in tag: {tag_name} not found.")
                 continue
 
-            if prop.get("new") == prop.get("old"):
+            if new == old:
                 self._print_warning(f"Old and new properties are the same for action: {action} in tag: {tag_name}.")
                 continue
 
@@ -111,22 +153,156 @@ class ConfigManager:
             dict: The loaded YAML content.
 
         Raises:
-            FileNotFoundError: If the file is not found.
-            yaml.YAMLError: If there is an error parsing the YAML file.
-            Exception: For any other errors during file reading.
+            ConfigLoadError: If the file is not found, cannot be parsed or cannot be read.
         """
         try:
-            with open(path, "r") as file:
-                return safe_load(file)
-        except FileNotFoundError:
-            self._print_error(f"The file {path} was not found.")
-            exit(-1)
-        except yaml.YAMLError:
-            self._print_error(f"The file {path} could not be read.")
-            exit(-1)
+            with open(path, "rb") as file:
+                return yaml.load(file, Loader=_Loader)
+        except FileNotFoundError as e:
+            raise ConfigLoadError(f"The file {path} was not found.") from e
+        except yaml.YAMLError as e:
+            raise ConfigLoadError(f"The file {path} could not be read.") from e
         except Exception as e:
-            self._print_error(f"An error occurred: {e}")
-            exit(-1)
+            raise ConfigLoadError(f"An error occurred: {e}") from e
+
+    def _load_yaml_streaming(self, path: Path) -> Iterator[Any]:
+        """
+        Stream the entries of the tags list from the YAML file at the given path.
+
+        Each entry is composed and constructed by the loader on its own, so only the
+        entry currently being read is held in memory. This needs the pure-Python
+        SafeLoader, since LibYAML's parser cannot compose a single node. If the tags
+        list is anchored or tagged, or the document root is not a plain mapping, the
+        affected node is loaded as a whole instead.
+
+        Unlike a full load, the first top-level tags key is used if there are several,
+        and a file with more than one document is only rejected after its entries
+        have been yielded.
+
+        Args:
+            path (Path): The path to the YAML file.
+
+        Yields:
+            Any: The next tag entry, or _NO_TAGS once if the file has no tags.
+
+        Raises:
+            ConfigLoadError: If the file is not found, cannot be parsed or cannot be read.
+        """
+        try:
+            with open(path, "rb") as file:
+                loader = yaml.SafeLoader(file)
+                try:
+                    yield from self._stream_tags(loader)
+                finally:
+                    loader.dispose()
+        except FileNotFoundError as e:
+            raise ConfigLoadError(f"The file {path} was not found.") from e
+        except yaml.YAMLError as e:
+            raise ConfigLoadError(f"The file {path} could not be read.") from e
+        except Exception as e:
+            raise ConfigLoadError(f"An error occurred: {e}") from e
+
+    def _stream_tags(self, loader: yaml.SafeLoader) -> Iterator[Any]:
+        """
+        Stream the entries of the tags list from a loader's event stream.
+
+        Args:
+            loader (yaml.SafeLoader): The loader to read the document from.
+
+        Yields:
+            Any: The next tag entry, or _NO_TAGS once if the document has no tags.
+
+        Raises:
+            yaml.YAMLError: If the document cannot be parsed or contains more than one document.
+        """
+        loader.get_event()
+        if loader.check_event(yaml.StreamEndEvent):
+            yield _NO_TAGS
+            return
+
+        loader.get_event()
+        if not self._is_plain_collection(loader, yaml.MappingStartEvent, _MAP_TAG):
+            root = loader.construct_document(loader.compose_node(None, None))
+            yield from self._whole_tags((root or {}).get("tags"))
+        else:
+            loader.get_event()
+            found = False
+            merges = []
+            while not loader.check_event(yaml.MappingEndEvent):
+                key_node = loader.compose_node(None, None)
+                if key_node.tag == _MERGE_TAG:
+                    merges.append((key_node, loader.compose_node(None, None)))
+                    continue
+
+                if found or loader.construct_document(key_node) != "tags":
+                    loader.compose_node(None, None)
+                    continue
+
+                found = True
+                if self._is_plain_collection(loader, yaml.SequenceStartEvent, _SEQ_TAG):
+                    loader.get_event()
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        yield loader.construct_document(loader.compose_node(None, None))
+                    loader.get_event()
+                else:
+                    yield from self._whole_tags(loader.construct_document(loader.compose_node(None, None)))
+            loader.get_event()
+
+            if not found:
+                merged = loader.construct_document(yaml.MappingNode(_MAP_TAG, merges)) if merges else {}
+                yield from self._whole_tags(merged.get("tags"))
+
+        loader.get_event()
+        if not loader.check_event(yaml.StreamEndEvent):
+            raise yaml.YAMLError("Expected a single document in the configuration file.")
+
+    @staticmethod
+    def _whole_tags(tags: Any) -> Iterator[Any]:
+        """
+        Yield the entries of a tags value that was loaded as a whole.
+
+        Args:
+            tags (Any): The loaded value of the tags key.
+
+        Yields:
+            Any: The next tag entry, or _NO_TAGS once if the value is None.
+        """
+        if tags is None:
+            yield _NO_TAGS
+        else:
+            yield from tags
+
+    @staticmethod
+    def _is_plain_collection(loader: yaml.SafeLoader, event_type: type, default_tag: str) -> bool:
+        """
+        Check whether the next event starts an untagged, unanchored collection of the given type.
+
+        Args:
+            loader (yaml.SafeLoader): The loader to read the events from.
+            event_type (type): The expected start event type.
+            default_tag (str): The tag of the collection type.
+
+        Returns:
+            bool: True if the collection can be streamed entry by entry, False otherwise.
+        """
+        event = loader.peek_event()
+        return isinstance(event, event_type) and event.anchor is None and event.tag in (None, "!", default_tag)
+
+    @staticmethod
+    def _use_streaming(path: Path) -> bool:
+        """
+        Check whether the YAML file at the given path should be streamed.
+
+        Args:
+            path (Path): The path to the YAML file.
+
+        Returns:
+            bool: True if the file is larger than the streaming threshold, False otherwise.
+        """
+        try:
+            return path.stat().st_size > _STREAMING_THRESHOLD
+        except OSError:
+            return False
 
     @staticmethod
     def _print_error(msg):
@@ -1,5 +1,13 @@
+import sys
+from typing import List, Optional, TextIO
+
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 
 class PropertyChangeTracker:
     """
@@ -7,8 +15,8 @@ class PropertyChangeTracker:
 
     Attributes:
         _filename (str): The name of the file being modified.
-        _old_frontmatter (dict): The original YAML metadata before changes.
-        _new_frontmatter (dict): The updated YAML metadata after changes.
+        _old_frontmatter (dict): The affected YAML properties before changes.
+        _new_frontmatter (dict): The affected YAML properties after changes.
         _changes (list): A list of changes, with each change represented as a dictionary.
         _logs (list): A list of log messages for problems or annotations.
     """
@@ -19,8 +27,8 @@ class PropertyChangeTracker:
 
         Args:
             filename (str): The name of the file being modified.
-            old_frontmatter (dict): The original YAML metadata before changes.
-            new_frontmatter (dict): The updated YAML metadata after changes.
+            old_frontmatter (dict): The affected YAML properties before changes.
+            new_frontmatter (dict): The affected YAML properties after changes.
         """
         self._filename = filename
         self._old_frontmatter = old_frontmatter
@@ -132,45 +140,56 @@ class PropertyChangeTracker:
         """
         self._logs.append(message)
 
-    def show_summary(self) -> None:
+    def show_summary(self, out: Optional[TextIO] = None) -> None:
         """
         Display a summary of changes and logs in a structured format.
+
+        The summary is assembled in memory and written with a single call.
+
+        Args:
+            out (TextIO, optional): The stream to write the summary to. Defaults to standard output.
         """
-        print("=" * 40)
-        print(f"Summary for File: {self._filename}")
-        print("=" * 40)
+        lines: List[str] = [
+            "=" * 40,
+            f"Summary for File: {self._filename}",
+            "=" * 40,
+        ]
 
-        # Old Frontmatter
+        # Old Affected Properties
         if self._old_frontmatter:
-            print("\n[Old Frontmatter]")
-            print(yaml.dump(self._old_frontmatter, default_flow_style=False, allow_unicode=True))
+            lines.append("\n[Old Affected Properties]")
+            lines.append(yaml.dump(self._old_frontmatter, Dumper=_Dumper, default_flow_style=False, allow_unicode=True,
+                                   sort_keys=False))
         else:
-            print("\n[Old Frontmatter] None")
+            lines.append("\n[Old Affected Properties] none affected")
 
-        # New Frontmatter
+        # New Affected Properties
         if self._new_frontmatter:
-            print("\n[New Frontmatter]")
-            print(yaml.dump(self._new_frontmatter, default_flow_style=False, allow_unicode=True))
+            lines.append("\n[New Affected Properties]")
+            lines.append(yaml.dump(self._new_frontmatter, Dumper=_Dumper, default_flow_style=False, allow_unicode=True,
+                                   sort_keys=False))
         else:
-            print("\n[New Frontmatter] None")
+            lines.append("\n[New Affected Properties] none affected")
 
         # Changes
         if self._changes:
-            print("\n[Changes]")
+            lines.append("\n[Changes]")
             for change in self._changes:
-                print(f"Action: {change.get('action')}")
+                lines.append(f"Action: {change.get('action')}")
                 if change.get('old_property'):
-                    print(f"  Old Property: {change.get('old_property')}")
+                    lines.append(f"  Old Property: {change.get('old_property')}")
                 if change.get('new_property'):
-                    print(f"  New Property: {change.get('new_property')}")
+                    lines.append(f"  New Property: {change.get('new_property')}")
                 if change.get('old_value') is not None:
-                    print(f"  Old Value: {change.get('old_value')}")
+                    lines.append(f"  Old Value: {change.get('old_value')}")
                 if change.get('new_value') is not None:
-                    print(f"  New Value: {change.get('new_value')}")
-                print("-" * 20)
+                    lines.append(f"  New Value: {change.get('new_value')}")
+                lines.append("-" * 20)
 
         # Logs
         if self._logs:
-            print("\n[Logs]")
+            lines.append("\n[Logs]")
             for log in self._logs:
-                print(f" - {log}")
+                lines.append(f" - {log}")
+
+        (out or sys.stdout).write("\n".join(lines) + "\n")
@@ -1,7 +1,10 @@
-import shutil
-from copy import deepcopy
+import io
+import sys
+import zipfile
+from collections import defaultdict
+from copy import copy
 from pathlib import Path
-from typing import Union, Optional, List
+from typing import Callable, Optional, List
 
 from src.library.note import Notes, Note
 from src.library.metadata import MetadataType
@@ -9,6 +12,11 @@ from src.library.metadata import MetadataType
 from src.core.config_manager import ConfigManager
 from src.core.property_change_tracker import PropertyChangeTracker
 
+# Files with these extensions are already compressed and are stored in the backup as-is.
+_STORED_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf", ".mp3", ".mp4", ".zip",
+})
+
 
 class PropertyProcessor:
     """
@@ -18,6 +26,7 @@ class PropertyProcessor:
         _notes (Notes): The collection of notes to be processed.
         _config (ConfigManager): The configuration object for parsing the YAML file.
         _current_note (Optional[Note]): The note currently being processed.
+        _processed_notes (dict[Path, Note]): The notes that were processed, keyed by their path.
         _all_changes (List[tuple[Path, List[PropertyChangeTracker]]]): A record of all changes made to the notes.
         _change_tracker (PropertyChangeTracker): Tracks changes for the currently processed note.
     """
@@ -34,6 +43,7 @@ class PropertyProcessor:
         self._notes = Notes(vault_path)
         self._config = ConfigManager(yaml_path)
         self._current_note: Optional[Note] = None
+        self._processed_notes: dict[Path, Note] = {}
         self._all_changes: List[PropertyChangeTracker] = []
         self._change_tracker: PropertyChangeTracker = PropertyChangeTracker("", {}, {})
 
@@ -41,22 +51,29 @@ class PropertyProcessor:
         """
         Execute the renaming, adding, and removing of properties based on the YAML configuration.
         """
+        notes_by_tag = self._build_tag_index()
+
         for tag, properties in self._config.get_next_tag():
             if not tag or not properties:
                 continue
 
-            notes = self._get_filtered_notes([("tags", tag, None)])
+            notes = notes_by_tag.get(tag)
             if not notes:
                 continue
 
-            for note in notes.notes:
+            touched_keys = self._get_touched_keys(properties)
+            actions = self._compile_actions(properties)
+
+            for note in notes:
                 self._current_note = note
+                self._processed_notes[note.path] = note
                 self._change_tracker = PropertyChangeTracker(str(note.path), {}, {})
-                self._change_tracker.old_frontmatter = deepcopy(note.metadata.frontmatter.metadata)
+                self._change_tracker.old_frontmatter = self._snapshot_frontmatter(note, touched_keys)
 
-                self._process_properties(properties)
+                for action, args in actions:
+                    action(*args)
 
-                self._change_tracker.new_frontmatter = deepcopy(self._current_note.metadata.frontmatter.metadata)
+                self._change_tracker.new_frontmatter = self._snapshot_frontmatter(note, touched_keys)
                 self._all_changes.append(self._change_tracker)
 
         self._finish()
@@ -66,8 +83,10 @@ class PropertyProcessor:
         Finalize the processing by showing a summary of changes and updating the notes.
         Allows the user to cancel the operation with Ctrl+C.
         """
+        summary = io.StringIO()
         for change in self._all_changes:
-            change.show_summary()
+            change.show_summary(summary)
+        sys.stdout.write(summary.getvalue())
 
         try:
             input("Press Enter to continue...")
@@ -76,8 +95,9 @@ class PropertyProcessor:
             return
 
         self._backup_vault()
-        self._notes.update_content()
-        self._notes.write()
+        for note in self._processed_notes.values():
+            note.update_content()
+            note.write()
 
         print("Changes saved successfully.")
 
@@ -140,38 +160,77 @@ class PropertyProcessor:
         else:
             self._change_tracker.add_log(f"Property '{prop}' not found.")
 
-    def _get_filtered_notes(
-            self,
-            meta_data: list[tuple[str, Union[list[str], str, None], Optional[MetadataType]]]
-    ) -> Optional[Notes]:
+    def _build_tag_index(self) -> dict[str, List[Note]]:
         """
-        Filter notes based on metadata.
+        Group the notes by their tags in a single pass over the vault.
 
-        Args:
-            meta_data (list): A list of metadata filters.
+        Tags from both the frontmatter and the inline metadata are considered.
 
         Returns:
-            Notes: A filtered collection of notes.
+            dict[str, List[Note]]: The notes carrying each tag.
         """
-        notes = self._notes
-        notes.filter(has_meta=meta_data)
-        return notes
+        notes_by_tag: dict[str, List[Note]] = defaultdict(list)
+        for note in self._notes.notes:
+            for tag in dict.fromkeys(note.metadata.get("tags") or []):
+                notes_by_tag[tag].append(note)
+        return notes_by_tag
 
-    def _process_properties(self, properties: list[dict]) -> None:
+    def _compile_actions(self, properties: list[dict]) -> list[tuple[Callable[..., None], tuple]]:
         """
-        Process a list of property changes for the current note.
+        Translate a list of property changes into the calls to apply to each note.
 
         Args:
             properties (list): A list of property change configurations.
+
+        Returns:
+            list[tuple[Callable, tuple]]: The methods to call with their arguments, in configuration order.
         """
+        actions: list[tuple[Callable[..., None], tuple]] = []
         for prop in properties:
             action = prop.get("action")
             if action == "add":
-                self._add_property(prop.get("new"), prop.get("default"))
+                actions.append((self._add_property, (prop.get("new"), prop.get("default"))))
             elif action == "rename":
-                self._rename_property(prop.get("old"), prop.get("new"))
+                actions.append((self._rename_property, (prop.get("old"), prop.get("new"))))
             elif action == "remove":
-                self._remove_property(prop.get("old"))
+                actions.append((self._remove_property, (prop.get("old"),)))
+        return actions
+
+    @staticmethod
+    def _get_touched_keys(properties: list[dict]) -> list[str]:
+        """
+        Collect the property names that a list of property changes can affect.
+
+        Args:
+            properties (list): A list of property change configurations.
+
+        Returns:
+            list[str]: The affected property names, in configuration order.
+        """
+        keys = {}
+        for prop in properties:
+            for key in (prop.get("old"), prop.get("new")):
+                if key:
+                    keys[key] = None
+        return list(keys)
+
+    @staticmethod
+    def _snapshot_frontmatter(note: Note, keys: list[str]) -> dict:
+        """
+        Capture the current values of the given frontmatter properties of a note.
+
+        Only the listed keys are copied, so the snapshot stays small regardless of
+        the size of the note's frontmatter.
+
+        Args:
+            note (Note): The note to take the snapshot from.
+            keys (list[str]): The property names to capture.
+
+        Returns:
+            dict: The captured properties that are present in the note.
+        """
+        frontmatter = note.metadata.frontmatter.metadata
+        return {key: copy(frontmatter[key]) for key in keys if key in frontmatter}
 
     def _backup_vault(self) -> None:
         """
@@ -179,7 +238,15 @@ class PropertyProcessor:
         """
         try:
             vault_backup_path = self._vault_path.parent / f"{self._vault_path.name}_backup.zip"
-            shutil.make_archive(str(vault_backup_path).replace('.zip', ''), 'zip', self._vault_path)
+            with zipfile.ZipFile(vault_backup_path, "w", allowZip64=True) as backup:
+                for path in self._vault_path.rglob("*"):
+                    if not path.is_file():
+                        continue
+                    if path.suffix.lower() in _STORED_EXTENSIONS:
+                        backup.write(path, path.relative_to(self._vault_path), compress_type=zipfile.ZIP_STORED)
+                    else:
+                        backup.write(path, path.relative_to(self._vault_path), compress_type=zipfile.ZIP_DEFLATED,
+                                     compresslevel=1)
             print(f"Backup created at {vault_backup_path}")
         except Exception as e:
             print(f"An error occurred while creating a backup: {e}")
@@ -1,5 +1,7 @@
+import sys
 from pathlib import Path
 from core.property_processor import PropertyProcessor
+from src.core.config_manager import ConfigLoadError
 
 
 def start() -> None:
@@ -18,8 +20,12 @@ def start() -> None:
             print("The provided path to the configuration file is not valid. Please try again.")
             continue
 
-        property_processor = PropertyProcessor(directory_path, config_file_path)
-        property_processor.run()
+        try:
+            property_processor = PropertyProcessor(directory_path, config_file_path)
+            property_processor.run()
+        except ConfigLoadError as e:
+            print(f"[ERROR] - {e}")
+            sys.exit(1)
         break
 
 
@@ -0,0 +1,133 @@
+import contextlib
+import io
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.core import config_manager
+from src.core.config_manager import ConfigLoadError, ConfigManager
+
+CONFIGS = {
+    "basic": """
+        version: 1
+        tags:
+          - tag: book
+            properties:
+              - {action: rename, old: author, new: writer}
+              - {action: add, new: read, default: 5}
+              - {action: remove, old: "yes", flag: yes, date: 2024-01-01, text: !!str 12}
+          - tag: empty
+            properties: []
+    """,
+    "merge keys": """
+        base: &base {action: rename, old: x}
+        more: &more {default: 1, old: z}
+        tags:
+          - tag: a
+            properties:
+              - <<: *base
+                new: y
+              - <<: [*more, *base]
+                action: add
+                new: q
+              - {"<<": 5, action: remove, old: k}
+    """,
+    "top-level merge": """
+        shared: &shared
+          tags:
+            - tag: merged
+              properties: []
+        <<: *shared
+    """,
+    "top-level merge with explicit tags": """
+        shared: &shared
+          tags:
+            - tag: merged
+              properties: []
+        <<: *shared
+        tags:
+          - tag: explicit
+            properties: []
+    """,
+    "anchored tags list": """
+        tags: &t
+          - tag: a
+            properties: []
+        other: *t
+    """,
+    "recursive alias": """
+        tags:
+          - &x {tag: a, properties: [*x]}
+    """,
+    "set and omap": """
+        tags:
+          - tag: a
+            properties: !!set {x, y}
+          - tag: b
+            properties:
+              - {action: add, new: n, default: !!omap [first: 1, second: 2]}
+    """,
+    "null tags": "tags: null\n",
+    "missing tags": "version: 1\n",
+    "empty file": "",
+    "unknown tag": """
+        tags:
+          - !foo {tag: a, properties: []}
+    """,
+    "python object": """
+        tags:
+          - !!python/object:collections.OrderedDict {tag: a, properties: []}
+    """,
+    "multiple documents": """
+        tags:
+          - tag: a
+            properties: []
+        ---
+        tags: []
+    """,
+}
+
+
+class ConfigManagerStreamingTest(unittest.TestCase):
+    """Streamed and fully loaded configurations must produce the same tags."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+
+    def _load(self, path: Path, streaming: bool):
+        threshold = -1 if streaming else float("inf")
+        output = io.StringIO()
+        with mock.patch.object(config_manager, "_STREAMING_THRESHOLD", threshold), \
+                contextlib.redirect_stdout(output):
+            try:
+                manager = ConfigManager(path)
+                self.assertEqual(manager._streaming, streaming)
+                return list(manager.get_next_tag()), output.getvalue()
+            except ConfigLoadError:
+                return ConfigLoadError, None
+
+    def test_streaming_matches_full_load(self):
+        for name, content in CONFIGS.items():
+            with self.subTest(name):
+                path = Path(self._dir.name) / "config.yaml"
+                path.write_text(textwrap.dedent(content))
+                self.assertEqual(self._load(path, streaming=True), self._load(path, streaming=False))
+
+    def test_rejected_configs_raise(self):
+        for name in ("unknown tag", "python object", "multiple documents"):
+            with self.subTest(name):
+                path = Path(self._dir.name) / "config.yaml"
+                path.write_text(textwrap.dedent(CONFIGS[name]))
+                self.assertIs(self._load(path, streaming=True)[0], ConfigLoadError)
+
+    def test_first_duplicate_tags_key_is_streamed(self):
+        path = Path(self._dir.name) / "config.yaml"
+        path.write_text("tags:\n  - {tag: a, properties: []}\ntags:\n  - {tag: b, properties: []}\n")
+        self.assertEqual(self._load(path, streaming=True)[0], [("a", [])])
+
+
+if __name__ == "__main__":
+    unittest.main()